@@ -17,23 +17,47 @@ def cli():
 @click.option("--hours", default=0, help="Repeat every N hours.")
 @click.option("--minutes", default=0, help="Repeat every N minutes.")
 @click.option("--seconds", default=0, help="Repeat every N seconds.")
-def run(weeks, days, hours, minutes, seconds):
+@click.option(
+    "--workers",
+    default=None,
+    type=int,
+    help="Classifier worker processes (default: CLASSIFIER_WORKERS).",
+)
+@click.option(
+    "--threads-per-worker",
+    default=None,
+    type=int,
+    help="Torch threads per classifier worker (default: CLASSIFIER_THREADS_PER_WORKER).",
+)
+@click.option(
+    "--stream/--no-stream",
+    default=None,
+    help="Classify each page while fetching (default: PIPELINE_STREAMING).",
+)
+def run(weeks, days, hours, minutes, seconds, workers, threads_per_worker, stream):
     """Run the pipeline. One-shot by default, add interval flags to schedule."""
     import time
+    from functools import partial
     from ieee_papers_mapper.data.pipeline import run_pipeline
 
     has_schedule = any([weeks, days, hours, minutes, seconds])
+    job = partial(
+        run_pipeline,
+        workers=workers,
+        threads_per_worker=threads_per_worker,
+        stream=stream,
+    )
 
     if not has_schedule:
         click.echo("Running pipeline (one-shot)...")
-        result = run_pipeline()
+        result = job()
         click.echo("Done. New papers processed." if result else "No new papers found.")
         return
 
     from ieee_papers_mapper.config.scheduler import Scheduler
 
     scheduler = Scheduler(
-        job=run_pipeline,
+        job=job,
         weeks=weeks,
         days=days,
         hours=hours,
@@ -100,21 +124,98 @@ def verify():
     try:
         from ieee_papers_mapper.data.classify_papers import _get_classifier
 
-        click.echo("Classifier: available (lazy-load, not yet loaded)")
+        click.echo(
+            f"Classifier: available (backend '{cfg.CLASSIFIER_BACKEND}', "
+            "lazy-load, not yet loaded)"
+        )
     except ImportError:
         click.secho("Classifier: transformers not installed", fg="red")
 
     click.echo()
 
 
+@cli.command("classifier-serve")
+@click.option("--host", default=None, help="Host to bind to (default: 127.0.0.1).")
+@click.option("--port", default=None, type=int, help="Port to serve on.")
+def classifier_serve(host, port):
+    """Keep the classifier loaded and serve classification requests."""
+    from ieee_papers_mapper.config import config as cfg
+    from ieee_papers_mapper.data.classifier_daemon import serve
+
+    click.echo(
+        f"Loading classifier and serving on "
+        f"{host or cfg.CLASSIFIER_DAEMON_HOST}:{port or cfg.CLASSIFIER_DAEMON_PORT}..."
+    )
+    serve(host, port)
+
+
+@cli.command("classifier-parity")
+@click.option(
+    "--backend",
+    default=None,
+    help="Backend to check against fp32 torch (default: CLASSIFIER_BACKEND).",
+)
+@click.option("--sample", default=200, help="Prompts to draw when creating the sample.")
+@click.option("--resample", is_flag=True, help="Draw a fresh prompt sample.")
+@click.option(
+    "--tolerance",
+    default=None,
+    type=float,
+    help="Max absolute score difference (default: PARITY_TOLERANCE).",
+)
+def classifier_parity(backend, sample, resample, tolerance):
+    """Compare a classifier backend against fp32 torch on stored prompts."""
+    import duckdb
+    from ieee_papers_mapper.config import config as cfg
+    from ieee_papers_mapper.data.classifier_backends import (
+        check_parity,
+        load_parity_sample,
+    )
+
+    backend = backend or cfg.CLASSIFIER_BACKEND
+    conn = duckdb.connect(cfg.DB_PATH, read_only=True)
+    try:
+        prompts = load_parity_sample(conn, sample, resample)
+    finally:
+        conn.close()
+    if not prompts:
+        click.secho("No stored prompts to sample. Run the pipeline first.", fg="red")
+        raise SystemExit(1)
+
+    click.echo(f"Checking '{backend}' against 'torch' on {len(prompts)} prompts...")
+    report = check_parity(prompts, candidate=backend, tolerance=tolerance)
+    click.echo(f"  max |diff|:          {report['max_abs_diff']:.4f}")
+    click.echo(f"  mean |diff|:         {report['mean_abs_diff']:.4f}")
+    click.echo(f"  top-label agreement: {report['top_label_agreement']:.1%}")
+    if report["passed"]:
+        click.secho("Parity check PASSED", fg="green")
+    else:
+        click.secho("Parity check FAILED", fg="red")
+        raise SystemExit(1)
+
+
 @cli.command("db-reset")
 @click.confirmation_option(prompt="This will delete all data. Continue?")
-def db_reset():
+@click.option(
+    "--keep-cache/--drop-cache",
+    default=True,
+    help="Preserve the classification cache across the reset.",
+)
+def db_reset(keep_cache):
     """Delete and recreate the database from scratch."""
     import os
+    import tempfile
     from ieee_papers_mapper.config import config as cfg
     from ieee_papers_mapper.data.database import Database
 
+    cache_export = None
+    if keep_cache and os.path.exists(cfg.DB_PATH):
+        cache_export = os.path.join(tempfile.mkdtemp(), "classification_cache.parquet")
+        db = Database(name="ieee_papers", filepath=cfg.SRC_DIR)
+        if not db.export_table("classification_cache", cache_export):
+            cache_export = None
+        db.close()
+
     if os.path.exists(cfg.DB_PATH):
         os.remove(cfg.DB_PATH)
         click.echo(f"Deleted {cfg.DB_PATH}")
@@ -125,5 +226,9 @@ def db_reset():
 
     db = Database(name="ieee_papers", filepath=cfg.SRC_DIR)
     db.initialise()
+    if cache_export:
+        restored = db.import_table("classification_cache", cache_export)
+        os.remove(cache_export)
+        click.echo(f"Restored {restored} classification cache entries.")
     db.close()
     click.echo("Database recreated with all tables.")
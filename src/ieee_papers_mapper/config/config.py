@@ -30,8 +30,51 @@ IEEE_API_MAX_RECORDS = 50
 
 # Constants
 BASE_URL = "http://ieeexploreapi.ieee.org/api/v1/search/articles"
-DB_TABLES = ["papers", "authors", "index_terms", "prompts", "classification"]
+DB_TABLES = [
+    "papers",
+    "authors",
+    "index_terms",
+    "prompts",
+    "classification",
+    "classification_cache",
+]
 CATEGORIES = ["machine learning", "power electronics", "robotics"]
 
 # Models
 DEBERTA_V3_MODEL_NAME = "MoritzLaurer/deberta-v3-large-zeroshot-v2.0"
+
+# Prompts: token budget for the classifier premise, and the share of it
+# reserved for index terms when the abstract alone would fill it.
+PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "384"))
+PROMPT_TERM_SHARE = 0.15
+
+# Classification
+CLASSIFIER_BATCH_SIZE = int(os.getenv("CLASSIFIER_BATCH_SIZE", "16"))
+CLASSIFIER_WORKERS = int(os.getenv("CLASSIFIER_WORKERS", "1"))
+CLASSIFIER_THREADS_PER_WORKER = int(os.getenv("CLASSIFIER_THREADS_PER_WORKER", "0"))
+CLASSIFIER_SHARD_SIZE = 64
+CLASSIFY_CHUNK_SIZE = int(os.getenv("CLASSIFY_CHUNK_SIZE", "512"))
+CLASSIFIER_BACKEND = os.getenv("CLASSIFIER_BACKEND", "torch")
+ONNX_MODEL_DIR = os.path.join(SRC_DIR, "onnx_models")
+ONNX_QUANTIZATION_ARCH = os.getenv("ONNX_QUANTIZATION_ARCH", "avx512_vnni")
+PARITY_SAMPLE_FILE = os.path.join(CONFIG_DIR, "parity_sample.json")
+PARITY_TOLERANCE = 0.05
+
+# Classifier daemon (ieee-papers classifier-serve)
+CLASSIFIER_DAEMON_ENABLED = os.getenv("CLASSIFIER_DAEMON_ENABLED", "1") == "1"
+CLASSIFIER_DAEMON_HOST = "127.0.0.1"
+CLASSIFIER_DAEMON_PORT = int(os.getenv("CLASSIFIER_DAEMON_PORT", "8765"))
+CLASSIFIER_DAEMON_PROBE_TIMEOUT = 0.25
+
+# Streaming: classify each stored page while the next ones are fetched.
+PIPELINE_STREAMING = os.getenv("PIPELINE_STREAMING", "0") == "1"
+STREAM_QUEUE_SIZE = 8
+
+# Cascade: a small sentence encoder decides clear-cut papers, and only those
+# with a label score inside the uncertainty band go to the zero-shot model.
+CLASSIFIER_CASCADE = os.getenv("CLASSIFIER_CASCADE", "0") == "1"
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+CASCADE_LABEL_TEMPLATE = "This paper is about {}."
+CASCADE_SIMILARITY_CENTER = 0.3
+CASCADE_TEMPERATURE = 0.05
+CASCADE_UNCERTAINTY_BAND = (0.2, 0.8)
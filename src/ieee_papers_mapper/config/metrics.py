@@ -15,6 +15,13 @@ api_latency = Histogram(
     "api_request_duration_seconds", "IEEE API request latency", ["category"]
 )
 
+# Process stage
+prompt_tokens = Histogram(
+    "prompt_token_length",
+    "Tokens per classification prompt",
+    buckets=(32, 64, 128, 192, 256, 320, 384, 448, 512, 1024),
+)
+
 # Classification stage
 papers_classified = Counter(
     "papers_classified_total", "Papers classified", ["category"]
@@ -22,6 +29,14 @@ papers_classified = Counter(
 classification_latency = Histogram(
     "classification_duration_seconds", "Per-paper classification time"
 )
+classification_cache_lookups = Counter(
+    "classification_cache_lookups_total",
+    "Classification cache lookups",
+    ["result"],
+)
+cascade_routed = Counter(
+    "cascade_papers_total", "Papers decided per cascade stage", ["stage"]
+)
 
 # DB operations
 db_operations = Histogram(
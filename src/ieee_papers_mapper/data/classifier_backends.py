@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+
+"""
+Classifier Backends
+===================
+Builds the zero-shot classification pipeline for the configured inference
+backend:
+
+- ``torch``: the Hugging Face model in fp32 (reference).
+- ``onnx``: the same model exported to ONNX and run on ONNX Runtime.
+- ``onnx-int8``: the ONNX export with int8 dynamic quantization applied.
+
+ONNX exports are written once under ``cfg.ONNX_MODEL_DIR`` and reused by later
+runs. The ONNX backends need the optional ``optimum[onnxruntime]`` dependency.
+
+Also provides an accuracy-parity check that scores a stored sample of prompts
+with two backends and compares the confidences.
+"""
+
+import os
+import json
+import logging
+from ieee_papers_mapper.config import config as cfg
+from ieee_papers_mapper.exceptions import ClassifierBackendError
+
+logger = logging.getLogger("ieee_logger")
+
+BACKENDS = ("torch", "onnx", "onnx-int8")
+
+
+def load_classifier(backend: str, model_name: str | None = None):
+    """
+    Load a zero-shot classification pipeline for the given backend.
+
+    Parameters
+    ----------
+    backend : str
+        One of ``BACKENDS``.
+    model_name : str | None
+        Hugging Face model identifier. Defaults to `cfg.DEBERTA_V3_MODEL_NAME`.
+
+    Returns
+    -------
+    transformers.Pipeline
+        A callable zero-shot classification pipeline.
+
+    Raises
+    ------
+    ClassifierBackendError
+        If the backend is unknown or its dependencies are not installed.
+    """
+    model_name = model_name or cfg.DEBERTA_V3_MODEL_NAME
+    if backend not in BACKENDS:
+        raise ClassifierBackendError(
+            f"Unknown classifier backend '{backend}', expected one of {BACKENDS}"
+        )
+
+    from transformers import pipeline as hf_pipeline
+
+    logger.info(f"Loading classifier '{model_name}' with backend '{backend}'...")
+    if backend == "torch":
+        return hf_pipeline("zero-shot-classification", model=model_name)
+
+    model, tokenizer = _load_onnx_model(model_name, quantize=backend == "onnx-int8")
+    return hf_pipeline("zero-shot-classification", model=model, tokenizer=tokenizer)
+
+
+def _load_onnx_model(model_name: str, quantize: bool):
+    try:
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    except ImportError as e:
+        raise ClassifierBackendError(
+            "ONNX backends require optimum: pip install 'optimum[onnxruntime]'"
+        ) from e
+    from transformers import AutoTokenizer
+
+    export_dir = os.path.join(cfg.ONNX_MODEL_DIR, model_name.replace("/", "--"))
+    if not os.path.exists(os.path.join(export_dir, "model.onnx")):
+        logger.info(f"Exporting '{model_name}' to ONNX at {export_dir}...")
+        model = ORTModelForSequenceClassification.from_pretrained(
+            model_name, export=True
+        )
+        model.save_pretrained(export_dir)
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(export_dir)
+    tokenizer = AutoTokenizer.from_pretrained(export_dir)
+
+    if not quantize:
+        return ORTModelForSequenceClassification.from_pretrained(export_dir), tokenizer
+
+    quantized_dir = f"{export_dir}-int8"
+    if not os.path.exists(os.path.join(quantized_dir, "model_quantized.onnx")):
+        logger.info(f"Quantizing ONNX model to int8 at {quantized_dir}...")
+        qconfig = getattr(AutoQuantizationConfig, cfg.ONNX_QUANTIZATION_ARCH)(
+            is_static=False, per_channel=False
+        )
+        quantizer = ORTQuantizer.from_pretrained(export_dir)
+        quantizer.quantize(save_dir=quantized_dir, quantization_config=qconfig)
+    model = ORTModelForSequenceClassification.from_pretrained(
+        quantized_dir, file_name="model_quantized.onnx"
+    )
+    return model, tokenizer
+
+
+def load_parity_sample(connection, size: int, resample: bool = False) -> list[str]:
+    """
+    Load the stored parity sample, drawing it from the prompts table if needed.
+
+    The sample is persisted to `cfg.PARITY_SAMPLE_FILE` so that repeated checks
+    (and checks across model or backend upgrades) score identical prompts.
+
+    Parameters
+    ----------
+    connection : duckdb.DuckDBPyConnection
+        Connection to the papers database.
+    size : int
+        Number of prompts to draw when creating the sample.
+    resample : bool
+        Draw a fresh sample even if one is already stored.
+
+    Returns
+    -------
+    list[str]
+        The sampled prompt texts.
+    """
+    if os.path.exists(cfg.PARITY_SAMPLE_FILE) and not resample:
+        with open(cfg.PARITY_SAMPLE_FILE) as f:
+            return json.load(f)
+
+    # DuckDB only accepts constants in the sample clause.
+    rows = connection.execute(
+        f"SELECT prompt_text FROM prompts "
+        f"USING SAMPLE reservoir({int(size)} ROWS) REPEATABLE (42)"
+    ).fetchall()
+    prompts = [row[0] for row in rows]
+    with open(cfg.PARITY_SAMPLE_FILE, "w") as f:
+        json.dump(prompts, f, indent=4)
+    return prompts
+
+
+def compare_scores(reference: list[list], candidate: list[list]) -> dict:
+    """
+    Compare two backends' per-prompt (label, score) outputs.
+
+    Parameters
+    ----------
+    reference : list[list]
+        Per-prompt (label, score) tuples from the reference backend.
+    candidate : list[list]
+        Per-prompt (label, score) tuples from the candidate backend.
+
+    Returns
+    -------
+    dict
+        ``prompts``, ``max_abs_diff``, ``mean_abs_diff`` over all
+        (prompt, label) pairs, and ``top_label_agreement`` as a fraction.
+    """
+    diffs = []
+    top_matches = 0
+    for ref, cand in zip(reference, candidate):
+        ref_scores, cand_scores = dict(ref), dict(cand)
+        diffs.extend(
+            abs(ref_scores[label] - cand_scores[label]) for label in ref_scores
+        )
+        if max(ref_scores, key=ref_scores.get) == max(cand_scores, key=cand_scores.get):
+            top_matches += 1
+    n = len(reference)
+    return {
+        "prompts": n,
+        "max_abs_diff": max(diffs, default=0.0),
+        "mean_abs_diff": sum(diffs) / len(diffs) if diffs else 0.0,
+        "top_label_agreement": top_matches / n if n else 1.0,
+    }
+
+
+def check_parity(
+    prompts: list[str],
+    candidate: str,
+    reference: str = "torch",
+    tolerance: float | None = None,
+) -> dict:
+    """
+    Score prompts with two backends and check the confidences agree.
+
+    Parameters
+    ----------
+    prompts : list[str]
+        Prompt texts to score.
+    candidate : str
+        Backend under test.
+    reference : str
+        Backend used as ground truth, fp32 torch by default.
+    tolerance : float | None
+        Largest acceptable absolute score difference. Defaults to
+        `cfg.PARITY_TOLERANCE`.
+
+    Returns
+    -------
+    dict
+        The `compare_scores()` report plus a boolean ``passed``.
+    """
+    from ieee_papers_mapper.data.classify_papers import classify_texts
+
+    tolerance = cfg.PARITY_TOLERANCE if tolerance is None else tolerance
+    reference_scores = classify_texts(prompts, classifier=load_classifier(reference))
+    candidate_scores = classify_texts(prompts, classifier=load_classifier(candidate))
+    report = compare_scores(reference_scores, candidate_scores)
+    report["passed"] = report["max_abs_diff"] <= tolerance
+    return report
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+"""
+Classifier Daemon
+=================
+Keeps the zero-shot classifier warm in a long-lived process and serves batched
+classification requests over localhost HTTP, so one-shot pipeline runs do not
+pay the model load on every start.
+
+Endpoints:
+- ``GET /health``: liveness plus the model key the daemon scores with.
+- ``POST /classify``: ``{"texts": [...], "labels": [...], "batch_size": n}``
+  returns ``{"scores": [[[label, score], ...], ...]}`` in input order.
+
+`classify_texts()` calls `daemon_available()` and transparently routes through
+the daemon when one is running with the same model and backend.
+"""
+
+import logging
+import requests
+from ieee_papers_mapper.config import config as cfg
+from ieee_papers_mapper.exceptions import ClassifierDaemonError
+
+logger = logging.getLogger("ieee_logger")
+
+
+def create_app():
+    """Build the daemon's Flask app around the process-wide classifier."""
+    from flask import Flask, jsonify, request
+    from ieee_papers_mapper.data import classify_papers
+
+    app = Flask(__name__)
+
+    @app.route("/health")
+    def health():
+        return jsonify(
+            {"status": "healthy", "model": classify_papers.cache_model_key()}
+        )
+
+    @app.route("/classify", methods=["POST"])
+    def classify():
+        payload = request.get_json(force=True)
+        scores = classify_papers.classify_texts(
+            payload["texts"],
+            payload.get("batch_size"),
+            classifier=classify_papers._get_classifier(),
+            labels=payload.get("labels"),
+        )
+        return jsonify({"scores": scores})
+
+    return app
+
+
+def serve(host: str | None = None, port: int | None = None) -> None:
+    """Load the classifier, then serve requests until interrupted."""
+    from ieee_papers_mapper.data.classify_papers import _get_classifier
+
+    _get_classifier()
+    # Single-threaded on purpose: requests are batched, and concurrent
+    # forward passes would only contend for the same torch thread pool.
+    create_app().run(
+        host=host or cfg.CLASSIFIER_DAEMON_HOST,
+        port=port or cfg.CLASSIFIER_DAEMON_PORT,
+        threaded=False,
+    )
+
+
+def _daemon_url() -> str:
+    return f"http://{cfg.CLASSIFIER_DAEMON_HOST}:{cfg.CLASSIFIER_DAEMON_PORT}"
+
+
+def daemon_available(model_key: str) -> bool:
+    """
+    Whether a daemon is listening and scores with `model_key`.
+
+    A daemon serving a different model or backend is ignored, so switching
+    either never mixes scores from two models.
+    """
+    if not cfg.CLASSIFIER_DAEMON_ENABLED:
+        return False
+    try:
+        response = requests.get(
+            f"{_daemon_url()}/health", timeout=cfg.CLASSIFIER_DAEMON_PROBE_TIMEOUT
+        )
+        response.raise_for_status()
+        return response.json().get("model") == model_key
+    except (requests.exceptions.RequestException, ValueError):
+        return False
+
+
+def classify_via_daemon(
+    texts: list[str], labels: list[str], batch_size: int | None = None
+) -> list[list]:
+    """
+    Classify texts on the running daemon.
+
+    Returns
+    -------
+    list[list]
+        For each text, in input order, a list of (category, confidence) tuples.
+
+    Raises
+    ------
+    ClassifierDaemonError
+        If the request fails.
+    """
+    try:
+        response = requests.post(
+            f"{_daemon_url()}/classify",
+            json={"texts": texts, "labels": labels, "batch_size": batch_size},
+        )
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        raise ClassifierDaemonError(f"Classifier daemon request failed: {e}") from e
+    return [
+        [(label, score) for label, score in scores]
+        for scores in response.json()["scores"]
+    ]
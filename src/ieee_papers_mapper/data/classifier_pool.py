@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+"""
+Classifier Worker Pool
+======================
+Spreads zero-shot classification across several processes. Each worker loads
+the classifier once when it starts, pins its torch intra-op thread count, and
+keeps the model resident for every shard it receives. Shards of papers are
+submitted up front and their results stream back to the parent as they
+complete, so the parent can persist them while other shards are still running.
+"""
+
+import time
+import logging
+import multiprocessing as mp
+from typing import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pandas as pd
+from ieee_papers_mapper.config import config as cfg
+from ieee_papers_mapper.config.metrics import classification_latency
+from ieee_papers_mapper.models import ClassifiedPaper
+from ieee_papers_mapper.data import classify_papers
+
+logger = logging.getLogger("ieee_logger")
+
+
+def _init_worker(threads_per_worker: int | None) -> None:
+    """Pin torch threads and load the classifier once per worker process."""
+    if threads_per_worker:
+        import torch
+
+        torch.set_num_threads(threads_per_worker)
+    classify_papers._get_classifier()
+
+
+def _classify_shard(
+    paper_ids: list[int],
+    prompts: list[str],
+    batch_size: int | None,
+    labels: list[str] | None = None,
+) -> tuple[list[int], list[list], float]:
+    """Classify one shard inside a worker and return plain, picklable results."""
+    start = time.monotonic()
+    scores = classify_papers.classify_texts(prompts, batch_size, labels=labels)
+    return paper_ids, scores, time.monotonic() - start
+
+
+def _shard_frame(df: pd.DataFrame, shard_size: int) -> Iterator[pd.DataFrame]:
+    for offset in range(0, len(df), shard_size):
+        yield df.iloc[offset : offset + shard_size]
+
+
+class ClassifierPool:
+    """
+    Process pool of classifier workers, each holding its own model instance.
+
+    Use as a context manager so the workers (and their models) are torn down
+    once classification is finished.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        threads_per_worker: int | None = None,
+        batch_size: int | None = None,
+        shard_size: int | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        workers : int
+            Number of worker processes.
+        threads_per_worker : int | None
+            Torch intra-op threads per worker. Left to torch when None.
+        batch_size : int | None
+            Prompts per forward pass inside each worker.
+        shard_size : int | None
+            Papers per unit of work sent to a worker. Defaults to
+            `cfg.CLASSIFIER_SHARD_SIZE`.
+        """
+        self.workers = workers
+        self.threads_per_worker = threads_per_worker
+        self.batch_size = batch_size
+        self.shard_size = shard_size or cfg.CLASSIFIER_SHARD_SIZE
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "ClassifierPool":
+        logger.info(
+            f"Starting {self.workers} classifier workers "
+            f"({self.threads_per_worker or 'default'} threads each)..."
+        )
+        # Spawn rather than fork: forking a process with live torch thread
+        # pools can deadlock the children.
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.threads_per_worker,),
+        )
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def classify(
+        self, df: pd.DataFrame, labels: list[str] | None = None
+    ) -> Iterator[list[ClassifiedPaper]]:
+        """
+        Classify papers across the pool, yielding results shard by shard.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            DataFrame with `paper_id` and `prompt_text`.
+        labels : list[str] | None
+            Candidate labels. Defaults to `cfg.CATEGORIES`.
+
+        Yields
+        ------
+        list[ClassifiedPaper]
+            Classifications for one completed shard, in completion order.
+        """
+        if self._executor is None:
+            raise RuntimeError("ClassifierPool must be used as a context manager")
+        futures = [
+            self._executor.submit(
+                _classify_shard,
+                [int(pid) for pid in shard["paper_id"].tolist()],
+                shard["prompt_text"].tolist(),
+                self.batch_size,
+                labels,
+            )
+            for shard in _shard_frame(df, self.shard_size)
+        ]
+        for future in as_completed(futures):
+            paper_ids, scores, elapsed = future.result()
+            per_paper = elapsed / max(len(paper_ids), 1)
+            for _ in paper_ids:
+                classification_latency.observe(per_paper)
+            yield classify_papers.to_classified_papers(paper_ids, scores)
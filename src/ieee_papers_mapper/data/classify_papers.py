@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 
+import json
 import time
+import hashlib
 import pandas as pd
 import logging
 from ieee_papers_mapper.config import config as cfg
 from ieee_papers_mapper.config.metrics import classification_latency, papers_classified
 from ieee_papers_mapper.models import ClassifiedPaper
+from ieee_papers_mapper.data.classifier_backends import load_classifier
+from ieee_papers_mapper.data.classifier_daemon import (
+    daemon_available,
+    classify_via_daemon,
+)
 
 logger = logging.getLogger("ieee_logger")
 
@@ -15,12 +22,111 @@ _classifier = None
 def _get_classifier():
     global _classifier
     if _classifier is None:
-        from transformers import pipeline as hf_pipeline
+        _classifier = load_classifier(cfg.CLASSIFIER_BACKEND)
+    return _classifier
+
+
+def prompt_hash(text: str) -> str:
+    """Content address of a prompt, used as the classification cache key."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def cache_model_key() -> str:
+    """
+    Model identity recorded in classification cache keys.
+
+    Non-reference backends produce slightly different scores, so they are
+    cached separately from the fp32 model.
+    """
+    if cfg.CLASSIFIER_BACKEND == "torch":
+        return cfg.DEBERTA_V3_MODEL_NAME
+    return f"{cfg.DEBERTA_V3_MODEL_NAME}@{cfg.CLASSIFIER_BACKEND}"
+
+
+def label_set_key(labels: list[str]) -> str:
+    """Order-independent key for a set of candidate labels."""
+    return json.dumps(sorted(labels))
+
+
+def _length_buckets(texts: list[str], batch_size: int) -> list[list[int]]:
+    """
+    Group text indices into batches of similar length.
+
+    Sorting by length before batching keeps the prompts inside one forward
+    pass close in size, so the tokenizer pads them to a short common length.
+
+    Parameters:
+        texts (list[str]): The input texts.
+        batch_size (int): Maximum number of texts per batch.
+
+    Returns:
+        list[list[int]]: Batches of indices into `texts`.
+    """
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    return [order[i : i + batch_size] for i in range(0, len(order), batch_size)]
+
 
-        _classifier = hf_pipeline(
-            "zero-shot-classification", model=cfg.DEBERTA_V3_MODEL_NAME
+def classify_texts(
+    texts: list[str],
+    batch_size: int | None = None,
+    classifier=None,
+    labels: list[str] | None = None,
+) -> list[list]:
+    """
+    Classify many texts into multiple categories using batched inference.
+
+    Parameters:
+        texts (list[str]): The input texts to classify.
+        batch_size (int | None): Prompts per forward pass. Defaults to
+            `cfg.CLASSIFIER_BATCH_SIZE`.
+        classifier: Pipeline to use instead of the shared `_get_classifier()`
+            instance, e.g. a specific backend for parity checks. When None
+            and a classifier daemon with the same model is running, the
+            texts are classified by the daemon instead.
+        labels (list[str] | None): Candidate labels. Defaults to
+            `cfg.CATEGORIES`. Each label is scored independently
+            (`multi_label=True`), so a subset yields the same scores those
+            labels would get within the full set.
+
+    Returns:
+        list[list]: For each input text, in input order, a list of tuples
+            (category, confidence).
+    """
+    batch_size = batch_size or cfg.CLASSIFIER_BATCH_SIZE
+    labels = labels or cfg.CATEGORIES
+    if classifier is None:
+        if _classifier is None and daemon_available(cache_model_key()):
+            return _classify_on_daemon(texts, labels, batch_size)
+        classifier = _get_classifier()
+    results: list[list] = [[] for _ in texts]
+    for bucket in _length_buckets(texts, batch_size):
+        start = time.monotonic()
+        outputs = classifier(
+            [texts[i] for i in bucket],
+            candidate_labels=labels,
+            multi_label=True,
+            # The pipeline batches (premise, hypothesis) pairs, one per label.
+            batch_size=len(bucket) * len(labels),
         )
-    return _classifier
+        if isinstance(outputs, dict):
+            outputs = [outputs]
+        for i, output in zip(bucket, outputs):
+            results[i] = list(zip(output["labels"], output["scores"]))
+        per_paper = (time.monotonic() - start) / len(bucket)
+        for _ in bucket:
+            classification_latency.observe(per_paper)
+    return results
+
+
+def _classify_on_daemon(
+    texts: list[str], labels: list[str], batch_size: int
+) -> list[list]:
+    start = time.monotonic()
+    results = classify_via_daemon(texts, labels, batch_size)
+    per_paper = (time.monotonic() - start) / max(len(texts), 1)
+    for _ in texts:
+        classification_latency.observe(per_paper)
+    return results
 
 
 def classify_text(text: str) -> list:
@@ -33,29 +139,52 @@ def classify_text(text: str) -> list:
     Returns:
         list: A list of tuples (category, confidence).
     """
-    results = _get_classifier()(text, candidate_labels=cfg.CATEGORIES, multi_label=True)
-    return [
-        (label, score) for label, score in zip(results["labels"], results["scores"])
-    ]
+    return classify_texts([text], batch_size=1)[0]
 
 
-def classify_all_papers(df: pd.DataFrame) -> list[ClassifiedPaper]:
+def classify_all_papers(
+    df: pd.DataFrame, batch_size: int | None = None, labels: list[str] | None = None
+) -> list[ClassifiedPaper]:
     """
     Classify all papers and return their classifications.
 
     Parameters:
         df (pd.DataFrame): DataFrame with `paper_id` and `prompt_text`.
+        batch_size (int | None): Prompts per forward pass. Defaults to
+            `cfg.CLASSIFIER_BATCH_SIZE`.
+        labels (list[str] | None): Candidate labels. Defaults to
+            `cfg.CATEGORIES`.
 
     Returns:
         list[ClassifiedPaper]: List of ClassifiedPaper models.
     """
+    if df.empty:
+        return []
+    scores = classify_texts(df["prompt_text"].tolist(), batch_size, labels=labels)
+    return to_classified_papers(df["paper_id"].tolist(), scores)
+
+
+def to_classified_papers(
+    paper_ids: list[int], scores: list[list], stage: str = "zero_shot"
+) -> list[ClassifiedPaper]:
+    """
+    Wrap raw per-paper scores into validated models and count them.
+
+    Parameters:
+        paper_ids (list[int]): Paper identifiers, aligned with `scores`.
+        scores (list[list]): Per-paper lists of (category, confidence) tuples.
+        stage (str): Cascade stage that produced the scores.
+
+    Returns:
+        list[ClassifiedPaper]: One model per paper-category pair.
+    """
     classifications = []
-    for _, row in df.iterrows():
-        start = time.monotonic()
-        for cat, conf in classify_text(row["prompt_text"]):
+    for paper_id, paper_scores in zip(paper_ids, scores):
+        for cat, conf in paper_scores:
             classifications.append(
-                ClassifiedPaper(paper_id=row["paper_id"], category=cat, confidence=conf)
+                ClassifiedPaper(
+                    paper_id=int(paper_id), category=cat, confidence=conf, stage=stage
+                )
             )
             papers_classified.labels(category=cat).inc()
-        classification_latency.observe(time.monotonic() - start)
     return classifications
@@ -16,6 +16,9 @@ Functions:
     - initialise: Creates tables in the database if they don't exist.
     - create_all_tables: Creates all expected tables from scratch.
     - create_tables: Creates a specified subset of tables.
+    - add_missing_columns: Adds columns introduced after a table was created.
+    - export_table: Copies a table to a Parquet file.
+    - import_table: Appends rows from a Parquet file to a table.
     - connect: Opens a connection to the database.
     - close: Closes the active database connection.
 """
@@ -29,6 +32,13 @@ from ieee_papers_mapper.config import config as cfg
 
 logger = logging.getLogger("ieee_logger")
 
+# Columns added to existing tables after their first release, as
+# (column name, type and default). New databases get them from the DDL below.
+COLUMN_MIGRATIONS = {
+    "prompts": [("token_count", "INTEGER")],
+    "classification": [("stage", "TEXT DEFAULT 'zero_shot'")],
+}
+
 
 class Database:
     """Connection and schema manager for the IEEE Papers DuckDB database."""
@@ -70,6 +80,15 @@ class Database:
             )
             if missing_tables:
                 self.create_tables(missing_tables)
+            self.add_missing_columns()
+
+    def add_missing_columns(self):
+        for table, columns in COLUMN_MIGRATIONS.items():
+            for column, definition in columns:
+                self.connection.execute(
+                    f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column} {definition}"
+                )
+        self.connection.commit()
 
     def create_all_tables(self):
         conn = duckdb.connect(self.db_name)
@@ -137,6 +156,7 @@ class Database:
                         prompt_id INTEGER PRIMARY KEY DEFAULT nextval('prompts_id_seq'),
                         paper_id INTEGER,
                         prompt_text TEXT,
+                        token_count INTEGER,
                         FOREIGN KEY(paper_id) REFERENCES papers(paper_id)
                     )
                 """
@@ -150,16 +170,45 @@ class Database:
                         paper_id INTEGER,
                         category TEXT,
                         confidence REAL,
+                        stage TEXT DEFAULT 'zero_shot',
                         FOREIGN KEY(paper_id) REFERENCES papers(paper_id)
                     )
                 """
                 )
+            elif table == "classification_cache":
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS classification_cache (
+                        prompt_hash TEXT,
+                        model_name TEXT,
+                        label_set TEXT,
+                        labels TEXT[],
+                        scores DOUBLE[],
+                        PRIMARY KEY (prompt_hash, model_name, label_set)
+                    )
+                """
+                )
 
         if conn:
             conn.commit()
             conn.close()
             logger.info(f"Database '{self.db_name}' initialised successfully.")
 
+    def export_table(self, table: str, path: str) -> bool:
+        """Copy a table to a Parquet file. Returns False if the table is missing."""
+        if table not in self.get_existing_tables():
+            return False
+        self.connection.execute(f"COPY {table} TO '{path}' (FORMAT PARQUET)")
+        return True
+
+    def import_table(self, table: str, path: str) -> int:
+        """Append the rows of a Parquet file to a table. Returns the row count."""
+        self.connection.execute(
+            f"INSERT OR IGNORE INTO {table} SELECT * FROM read_parquet('{path}')"
+        )
+        self.connection.commit()
+        return self.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
     @property
     def is_connected(self) -> bool:
         if self.connection is None:
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+
+"""
+Embedding Classifier
+====================
+Fast first stage of the classification cascade. Prompts and candidate labels
+are embedded with a small sentence encoder, and label scores come from a single
+vectorised cosine-similarity matmul, squashed through a logistic calibration
+into [0, 1].
+
+Papers whose every label score falls outside `cfg.CASCADE_UNCERTAINTY_BAND` are
+decided here. The rest are ambiguous and are left for the zero-shot model.
+"""
+
+import time
+import logging
+import numpy as np
+import pandas as pd
+from ieee_papers_mapper.config import config as cfg
+from ieee_papers_mapper.config.metrics import cascade_routed, classification_latency
+from ieee_papers_mapper.models import ClassifiedPaper
+from ieee_papers_mapper.data.classify_papers import to_classified_papers
+
+logger = logging.getLogger("ieee_logger")
+
+STAGE = "embedding"
+
+_encoder = None
+_label_embeddings: dict[tuple[str, ...], np.ndarray] = {}
+
+
+def _get_encoder():
+    global _encoder
+    if _encoder is None:
+        from transformers import AutoModel, AutoTokenizer
+
+        logger.info(f"Loading sentence encoder '{cfg.EMBEDDING_MODEL_NAME}'...")
+        _encoder = (
+            AutoTokenizer.from_pretrained(cfg.EMBEDDING_MODEL_NAME),
+            AutoModel.from_pretrained(cfg.EMBEDDING_MODEL_NAME).eval(),
+        )
+    return _encoder
+
+
+def embed_texts(texts: list[str], batch_size: int | None = None) -> np.ndarray:
+    """
+    Embed texts as L2-normalised mean-pooled sentence vectors.
+
+    Parameters:
+        texts (list[str]): The input texts.
+        batch_size (int | None): Texts per forward pass. Defaults to
+            `cfg.CLASSIFIER_BATCH_SIZE`.
+
+    Returns:
+        np.ndarray: Array of shape (len(texts), dim) with unit-norm rows.
+    """
+    import torch
+
+    batch_size = batch_size or cfg.CLASSIFIER_BATCH_SIZE
+    tokenizer, model = _get_encoder()
+    chunks = []
+    with torch.no_grad():
+        for offset in range(0, len(texts), batch_size):
+            encoded = tokenizer(
+                texts[offset : offset + batch_size],
+                padding=True,
+                truncation=True,
+                return_tensors="pt",
+            )
+            hidden = model(**encoded).last_hidden_state
+            mask = encoded["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+            pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+            chunks.append(pooled.numpy())
+    embeddings = np.concatenate(chunks) if chunks else np.empty((0, 0))
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.clip(norms, 1e-12, None)
+
+
+def _get_label_embeddings(labels: list[str]) -> np.ndarray:
+    key = tuple(labels)
+    if key not in _label_embeddings:
+        _label_embeddings[key] = embed_texts(
+            [cfg.CASCADE_LABEL_TEMPLATE.format(label) for label in labels]
+        )
+    return _label_embeddings[key]
+
+
+def embedding_scores(texts: list[str], labels: list[str]) -> np.ndarray:
+    """
+    Score every text against every label.
+
+    Parameters:
+        texts (list[str]): The input texts.
+        labels (list[str]): Candidate labels.
+
+    Returns:
+        np.ndarray: Calibrated scores in [0, 1], shape (len(texts), len(labels)).
+    """
+    similarities = embed_texts(texts) @ _get_label_embeddings(labels).T
+    logits = (similarities - cfg.CASCADE_SIMILARITY_CENTER) / cfg.CASCADE_TEMPERATURE
+    return 1.0 / (1.0 + np.exp(-logits))
+
+
+def confident_mask(scores: np.ndarray, band: tuple[float, float]) -> np.ndarray:
+    """Rows whose scores all fall outside the open uncertainty band."""
+    low, high = band
+    return ~((scores > low) & (scores < high)).any(axis=1)
+
+
+def classify_first_stage(
+    df: pd.DataFrame, labels: list[str]
+) -> tuple[list[ClassifiedPaper], pd.DataFrame]:
+    """
+    Decide clear-cut papers with the embedding classifier.
+
+    Parameters:
+        df (pd.DataFrame): DataFrame with `paper_id` and `prompt_text`.
+        labels (list[str]): Candidate labels.
+
+    Returns:
+        tuple[list[ClassifiedPaper], pd.DataFrame]: Classifications for the
+            confident papers (stage "embedding"), and the ambiguous papers
+            that still need the zero-shot model.
+    """
+    if df.empty:
+        return [], df
+    start = time.monotonic()
+    scores = embedding_scores(df["prompt_text"].tolist(), labels)
+    mask = confident_mask(scores, cfg.CASCADE_UNCERTAINTY_BAND)
+    per_paper = (time.monotonic() - start) / len(df)
+    for _ in range(int(mask.sum())):
+        classification_latency.observe(per_paper)
+
+    paper_ids = df.loc[mask, "paper_id"].tolist()
+    accepted = to_classified_papers(
+        paper_ids,
+        [list(zip(labels, row.tolist())) for row in scores[mask]],
+        stage=STAGE,
+    )
+    cascade_routed.labels(stage=STAGE).inc(len(paper_ids))
+    cascade_routed.labels(stage="zero_shot").inc(len(df) - len(paper_ids))
+    logger.debug(
+        f"Embedding stage decided {len(paper_ids)} of {len(df)} papers, "
+        f"{len(df) - len(paper_ids)} go to the zero-shot model."
+    )
+    return accepted, df[~mask]
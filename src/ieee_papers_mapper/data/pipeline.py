@@ -16,6 +16,11 @@ import json
 import time
 import uuid
 import logging
+import queue
+import threading
+import contextlib
+import pandas as pd
+from typing import Callable
 from ieee_papers_mapper.config import config as cfg
 from ieee_papers_mapper.config.metrics import (
     pipeline_runs,
@@ -26,13 +31,23 @@ from ieee_papers_mapper.config.metrics import (
     total_papers_gauge,
     unclassified_gauge,
     last_successful_run,
+    classification_cache_lookups,
 )
+from ieee_papers_mapper.models import ClassifiedPaper
 from ieee_papers_mapper.exceptions import IEEEApiError
 from ieee_papers_mapper.data.database import Database
 from ieee_papers_mapper.data.repository import PaperRepository
 from ieee_papers_mapper.data.get_papers import get_papers
 from ieee_papers_mapper.data.process_papers import process_papers
-from ieee_papers_mapper.data.classify_papers import classify_all_papers
+from ieee_papers_mapper.data.classify_papers import (
+    classify_all_papers,
+    to_classified_papers,
+    prompt_hash,
+    cache_model_key,
+    label_set_key,
+)
+from ieee_papers_mapper.data.classifier_pool import ClassifierPool
+from ieee_papers_mapper.data.embedding_classifier import classify_first_stage
 
 logger = logging.getLogger("ieee_logger")
 
@@ -52,13 +67,33 @@ class ProgressTracker:
             json.dump(progress, f, indent=4)
 
 
-def run_pipeline() -> bool:
+def run_pipeline(
+    workers: int | None = None,
+    threads_per_worker: int | None = None,
+    stream: bool | None = None,
+) -> bool:
     """
     Executes the full data pipeline.
 
     Fetches new papers incrementally per category, stores them via the
     repository, then classifies any unclassified papers.
 
+    In streaming mode, each stored page is pushed onto a bounded queue and
+    classified by a background thread while the next pages are fetched, so
+    inference overlaps with network waits and papers reach the dashboard
+    page by page. A final pass still classifies anything left over.
+
+    Parameters
+    ----------
+    workers : int | None
+        Classifier worker processes. Defaults to `cfg.CLASSIFIER_WORKERS`;
+        values above 1 classify through a `ClassifierPool`.
+    threads_per_worker : int | None
+        Torch intra-op threads per classifier worker. Defaults to
+        `cfg.CLASSIFIER_THREADS_PER_WORKER` (0 leaves it to torch).
+    stream : bool | None
+        Classify pages while fetching. Defaults to `cfg.PIPELINE_STREAMING`.
+
     Returns
     -------
     bool
@@ -73,10 +108,18 @@ def run_pipeline() -> bool:
     repo = PaperRepository(db.connection)
     tracker = ProgressTracker(cfg.JSON_FILENAME, cfg.CONFIG_DIR)
 
+    stream = cfg.PIPELINE_STREAMING if stream is None else stream
+
     try:
-        new_papers = _fetch_and_store(repo, tracker, run_id)
-        if new_papers:
-            _classify_new_papers(repo, run_id)
+        if stream:
+            new_papers = _fetch_and_classify_streaming(
+                db, repo, tracker, run_id, workers, threads_per_worker
+            )
+        else:
+            new_papers = _fetch_and_store(repo, tracker, run_id)
+        # Runs even without new papers so that newly added categories are
+        # scored for papers classified before they existed.
+        _classify_new_papers(repo, run_id, workers, threads_per_worker)
         pipeline_runs.labels(status="success").inc()
         total_papers_gauge.set(repo.count_papers())
         unclassified_gauge.set(repo.count_unclassified())
@@ -90,7 +133,57 @@ def run_pipeline() -> bool:
         db.close()
 
 
-def _fetch_and_store(repo: PaperRepository, tracker: ProgressTracker, run_id: str) -> bool:
+def _fetch_and_classify_streaming(
+    db: Database,
+    repo: PaperRepository,
+    tracker: ProgressTracker,
+    run_id: str,
+    workers: int | None,
+    threads_per_worker: int | None,
+) -> bool:
+    """
+    Runs `_fetch_and_store` while a background thread classifies each page.
+
+    The consumer gets its own cursor on the database connection. The queue is
+    bounded by `cfg.STREAM_QUEUE_SIZE` pages, so fetching pauses whenever
+    classification falls that far behind.
+
+    Returns
+    -------
+    bool
+        True if at least one new paper was retrieved, False otherwise.
+    """
+    pages: queue.Queue = queue.Queue(maxsize=cfg.STREAM_QUEUE_SIZE)
+    errors: list[BaseException] = []
+    consumer = threading.Thread(
+        target=_stream_classifications,
+        args=(
+            pages,
+            PaperRepository(db.connection.cursor()),
+            run_id,
+            workers,
+            threads_per_worker,
+            errors,
+        ),
+        name="stream-classifier",
+        daemon=True,
+    )
+    consumer.start()
+    try:
+        return _fetch_and_store(repo, tracker, run_id, on_page=pages.put)
+    finally:
+        pages.put(None)
+        consumer.join()
+        if errors:
+            raise errors[0]
+
+
+def _fetch_and_store(
+    repo: PaperRepository,
+    tracker: ProgressTracker,
+    run_id: str,
+    on_page: Callable[[list[int]], None] | None = None,
+) -> bool:
     """
     Fetches papers from the IEEE API for each configured category and stores
     them via the repository.
@@ -103,6 +196,8 @@ def _fetch_and_store(repo: PaperRepository, tracker: ProgressTracker, run_id: st
         Tracks per-category pagination progress across runs.
     run_id : str
         Identifier for the current pipeline run, used in log context.
+    on_page : Callable[[list[int]], None] | None
+        Called with the ids of the papers newly stored from each page.
 
     Returns
     -------
@@ -128,7 +223,9 @@ def _fetch_and_store(repo: PaperRepository, tracker: ProgressTracker, run_id: st
                     start_record=start_record,
                     max_records=cfg.IEEE_API_MAX_RECORDS,
                 )
-                api_latency.labels(category=category).observe(time.monotonic() - api_start)
+                api_latency.labels(category=category).observe(
+                    time.monotonic() - api_start
+                )
                 api_requests.labels(category=category, status="success").inc()
 
                 if df_raw.empty:
@@ -142,8 +239,10 @@ def _fetch_and_store(repo: PaperRepository, tracker: ProgressTracker, run_id: st
                 papers = process_papers(df_raw)
                 papers_fetched.labels(category=category).inc(len(papers))
 
-                for paper in papers:
-                    repo.insert_full_paper(paper)
+                paper_ids = [repo.insert_full_paper(paper) for paper in papers]
+                paper_ids = [pid for pid in paper_ids if pid is not None]
+                if on_page is not None and paper_ids:
+                    on_page(paper_ids)
 
                 start_record += cfg.IEEE_API_MAX_RECORDS
                 progress[category] = start_record
@@ -166,9 +265,157 @@ def _fetch_and_store(repo: PaperRepository, tracker: ProgressTracker, run_id: st
     return new_papers
 
 
-def _classify_new_papers(repo: PaperRepository, run_id: str) -> None:
+class ClassificationStage:
+    """
+    Classifies every paper that lacks a score for one of `cfg.CATEGORIES`.
+
+    Papers are grouped by the labels they are missing, and only those labels
+    are sent to the model: adding a category scores one new hypothesis per
+    paper and reuses the stored scores for the existing ones. Prompts already
+    scored by the same model against the same label set are served from the
+    classification cache, and fresh scores are added to it. When
+    `cfg.CLASSIFIER_CASCADE` is set, the embedding classifier decides the
+    clear-cut papers first and only ambiguous ones reach the zero-shot model.
+    With more than one worker, papers are classified by a `ClassifierPool`
+    that is started on first use and kept alive until the stage is closed,
+    and each shard's results are stored as soon as the shard completes.
     """
-    Retrieves unclassified papers and stores their classifications.
+
+    def __init__(
+        self,
+        repo: PaperRepository,
+        run_id: str,
+        workers: int | None = None,
+        threads_per_worker: int | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        repo : PaperRepository
+            Repository used to query and persist classification records.
+        run_id : str
+            Identifier for the current pipeline run, used in log context.
+        workers : int | None
+            Classifier worker processes. Defaults to `cfg.CLASSIFIER_WORKERS`.
+        threads_per_worker : int | None
+            Torch intra-op threads per worker. Defaults to
+            `cfg.CLASSIFIER_THREADS_PER_WORKER`.
+        """
+        self.repo = repo
+        self.run_id = run_id
+        self.workers = workers or cfg.CLASSIFIER_WORKERS
+        self.threads_per_worker = (
+            threads_per_worker or cfg.CLASSIFIER_THREADS_PER_WORKER
+        )
+        self._stack = contextlib.ExitStack()
+        self._pool: ClassifierPool | None = None
+
+    def __enter__(self) -> "ClassificationStage":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._stack.close()
+        self._pool = None
+
+    def _get_pool(self) -> ClassifierPool:
+        if self._pool is None:
+            self._pool = self._stack.enter_context(
+                ClassifierPool(self.workers, self.threads_per_worker or None)
+            )
+        return self._pool
+
+    def run(
+        self, paper_ids: list[int] | None = None, chunk_size: int | None = None
+    ) -> int:
+        """
+        Classifies and stores the papers with missing labels, chunk by chunk.
+
+        Each chunk is read, classified and committed before the next one is
+        read, so memory is bounded by the chunk size and an interrupted run
+        loses at most one chunk: the next run picks up the papers that still
+        lack labels.
+
+        Parameters
+        ----------
+        paper_ids : list[int] | None
+            Restrict classification to these papers. All papers when None.
+        chunk_size : int | None
+            Papers per committed chunk. Defaults to `cfg.CLASSIFY_CHUNK_SIZE`.
+
+        Returns
+        -------
+        int
+            Number of classification rows stored.
+        """
+        chunk_size = chunk_size or cfg.CLASSIFY_CHUNK_SIZE
+        stored, last_paper_id = 0, None
+        while True:
+            df_missing = self.repo.get_papers_missing_labels(
+                cfg.CATEGORIES,
+                paper_ids,
+                after_paper_id=last_paper_id,
+                limit=chunk_size,
+            )
+            if df_missing.empty:
+                break
+            stored += self._classify_chunk(df_missing)
+            last_paper_id = int(df_missing["paper_id"].iloc[-1])
+            logger.debug(
+                f"Committed classifications up to paper_id {last_paper_id}.",
+                extra={"run_id": self.run_id},
+            )
+        if stored:
+            logger.info(
+                f"Classified and stored {stored} papers.",
+                extra={"run_id": self.run_id},
+            )
+        return stored
+
+    def _classify_chunk(self, df_missing: pd.DataFrame) -> int:
+        repo = self.repo
+        hashes = dict(
+            zip(
+                df_missing["paper_id"].tolist(),
+                df_missing["prompt_text"].map(prompt_hash).tolist(),
+            )
+        )
+        label_groups = df_missing["missing_labels"].map(tuple)
+        stored = 0
+        for labels, df_group in df_missing.groupby(label_groups, sort=False):
+            labels = list(labels)
+            df_pending, from_cache = _apply_classification_cache(
+                repo, df_group, hashes, labels
+            )
+            stored += from_cache
+            if cfg.CLASSIFIER_CASCADE and not df_pending.empty:
+                accepted, df_pending = classify_first_stage(df_pending, labels)
+                if accepted:
+                    repo.insert_classifications(accepted)
+                    stored += len(accepted)
+            if df_pending.empty:
+                continue
+            if self.workers > 1:
+                results = self._get_pool().classify(df_pending, labels)
+            else:
+                results = [classify_all_papers(df_pending, labels=labels)]
+            for classifications in results:
+                repo.insert_classifications(classifications)
+                _cache_classifications(repo, classifications, hashes, labels)
+                stored += len(classifications)
+        return stored
+
+
+def _classify_new_papers(
+    repo: PaperRepository,
+    run_id: str,
+    workers: int | None = None,
+    threads_per_worker: int | None = None,
+) -> None:
+    """
+    Retrieves papers with missing labels and stores their classifications.
 
     Parameters
     ----------
@@ -176,15 +423,101 @@ def _classify_new_papers(repo: PaperRepository, run_id: str) -> None:
         Repository used to query and persist classification records.
     run_id : str
         Identifier for the current pipeline run, used in log context.
+    workers : int | None
+        Classifier worker processes. Defaults to `cfg.CLASSIFIER_WORKERS`.
+    threads_per_worker : int | None
+        Torch intra-op threads per worker. Defaults to
+        `cfg.CLASSIFIER_THREADS_PER_WORKER`.
+    """
+    with ClassificationStage(repo, run_id, workers, threads_per_worker) as stage:
+        stage.run()
+
+
+def _stream_classifications(
+    pages: queue.Queue,
+    repo: PaperRepository,
+    run_id: str,
+    workers: int | None,
+    threads_per_worker: int | None,
+    errors: list[BaseException],
+) -> None:
+    """
+    Consumes stored pages of paper ids and classifies them as they arrive.
+
+    Runs in a background thread until it receives a ``None`` sentinel. After a
+    failure it keeps draining the queue so the fetching thread never blocks;
+    the error is handed back through `errors`.
+    """
+    with ClassificationStage(repo, run_id, workers, threads_per_worker) as stage:
+        while (paper_ids := pages.get()) is not None:
+            if errors:
+                continue
+            try:
+                stage.run(paper_ids)
+            except Exception as e:
+                logger.exception(
+                    "Streaming classification failed", extra={"run_id": run_id}
+                )
+                errors.append(e)
+
+
+def _apply_classification_cache(
+    repo: PaperRepository,
+    df: pd.DataFrame,
+    hashes: dict[int, str],
+    labels: list[str],
+) -> tuple[pd.DataFrame, int]:
     """
-    df_unclassified = repo.get_unclassified_papers()
-    if df_unclassified.empty:
-        return
-    classifications = classify_all_papers(df_unclassified)
+    Stores classifications for papers whose prompts are already cached.
+
+    Parameters
+    ----------
+    repo : PaperRepository
+        Repository used to read the cache and persist classifications.
+    df : pd.DataFrame
+        Unclassified papers with `paper_id` and `prompt_text`.
+    hashes : dict[int, str]
+        Prompt hash per `paper_id`.
+    labels : list[str]
+        Labels the papers still need scores for.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, int]
+        The papers that still need the model, and the number of
+        classification rows stored from the cache.
+    """
+    df_hashes = df["paper_id"].map(hashes)
+    cached = repo.get_cached_classifications(
+        df_hashes.unique().tolist(), cache_model_key(), label_set_key(labels)
+    )
+    hit_mask = df_hashes.isin(cached)
+    hits = int(hit_mask.sum())
+    classification_cache_lookups.labels(result="hit").inc(hits)
+    classification_cache_lookups.labels(result="miss").inc(len(df) - hits)
+    if not hits:
+        return df, 0
+
+    paper_ids = df.loc[hit_mask, "paper_id"].tolist()
+    classifications = to_classified_papers(
+        paper_ids, [cached[hashes[paper_id]] for paper_id in paper_ids]
+    )
     repo.insert_classifications(classifications)
-    logger.info(
-        f"Classified and stored {len(classifications)} papers.",
-        extra={"run_id": run_id},
+    return df[~hit_mask], len(classifications)
+
+
+def _cache_classifications(
+    repo: PaperRepository,
+    classifications: list[ClassifiedPaper],
+    hashes: dict[int, str],
+    labels: list[str],
+) -> None:
+    """Adds freshly computed classifications to the cache by prompt hash."""
+    entries: dict[str, list[tuple[str, float]]] = {}
+    for c in classifications:
+        entries.setdefault(hashes[c.paper_id], []).append((c.category, c.confidence))
+    repo.insert_cached_classifications(
+        entries, cache_model_key(), label_set_key(labels)
     )
 
 
@@ -7,6 +7,7 @@ from datetime import datetime
 from pydantic import ValidationError
 from ieee_papers_mapper.models import ProcessedPaper, Author
 from ieee_papers_mapper.exceptions import PaperValidationError
+from ieee_papers_mapper.data.prompt_builder import build_prompt
 
 logger = logging.getLogger("ieee_logger")
 
@@ -21,6 +22,9 @@ def process_papers(df_raw: pd.DataFrame) -> list[ProcessedPaper]:
                 row.get("index_terms.dynamic_index_terms.terms", "[]")
             )
             insert_date = _parse_date(str(row["insert_date"]))
+            prompt, n_tokens = build_prompt(
+                row["title"], row["abstract"], ieee_terms, dynamic_terms
+            )
 
             paper = ProcessedPaper(
                 is_number=str(row["is_number"]),
@@ -33,9 +37,8 @@ def process_papers(df_raw: pd.DataFrame) -> list[ProcessedPaper]:
                 index_terms_ieee=ieee_terms,
                 index_terms_dynamic=dynamic_terms,
                 authors=authors,
-                prompt=_create_prompt(
-                    row["title"], row["abstract"], ieee_terms, dynamic_terms
-                ),
+                prompt=prompt,
+                prompt_tokens=n_tokens,
             )
             papers.append(paper)
         except (ValidationError, KeyError) as e:
@@ -79,6 +82,5 @@ def _extract_author_info(authors_raw) -> list[Author]:
 def _create_prompt(
     title: str, abstract: str, ieee_terms: list[str], dynamic_terms: list[str]
 ) -> str:
-    all_terms = ieee_terms + dynamic_terms
-    index_terms = ", ".join(all_terms)
-    return f"title: {title} - abstract: {abstract} - index_terms: {index_terms}"
+    prompt, _ = build_prompt(title, abstract, ieee_terms, dynamic_terms)
+    return prompt
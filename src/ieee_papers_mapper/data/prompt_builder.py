@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+
+"""
+Prompt Builder
+==============
+Builds classification prompts that fit a token budget measured with the
+classifier's own tokenizer. The title is always kept, index terms are ranked
+by signal (IEEE controlled vocabulary before dynamic terms, duplicates and
+terms already in the title dropped) and given a reserved share of the
+budget, and the abstract fills what remains from its head. The resulting
+token length is returned with each prompt so it can be stored and used to
+bound classification latency.
+"""
+
+import re
+import logging
+from ieee_papers_mapper.config import config as cfg
+from ieee_papers_mapper.config.metrics import prompt_tokens
+
+logger = logging.getLogger("ieee_logger")
+
+_tokenizer = None
+
+
+def _get_tokenizer():
+    global _tokenizer
+    if _tokenizer is None:
+        from transformers import AutoTokenizer
+
+        _tokenizer = AutoTokenizer.from_pretrained(cfg.DEBERTA_V3_MODEL_NAME)
+    return _tokenizer
+
+
+def _token_spans(text: str) -> list[tuple[int, int]]:
+    """Character spans of the tokens in `text`, without special tokens."""
+    if not text:
+        return []
+    encoded = _get_tokenizer()(
+        text, add_special_tokens=False, return_offsets_mapping=True
+    )
+    return encoded["offset_mapping"]
+
+
+def count_tokens(text: str) -> int:
+    return len(_token_spans(text))
+
+
+def _truncate(text: str, max_tokens: int) -> str:
+    spans = _token_spans(text)
+    if len(spans) <= max_tokens:
+        return text
+    if max_tokens <= 0:
+        return ""
+    return text[: spans[max_tokens - 1][1]]
+
+
+def rank_terms(
+    title: str, ieee_terms: list[str], dynamic_terms: list[str]
+) -> list[str]:
+    """
+    Order index terms by expected signal for classification.
+
+    IEEE terms come from a controlled vocabulary and are kept ahead of the
+    automatically generated dynamic terms. Case-insensitive duplicates and
+    terms already contained in the title add no information and are dropped.
+    """
+    seen = set()
+    lowered_title = title.lower()
+    ranked = []
+    for term in ieee_terms + dynamic_terms:
+        key = term.strip().lower()
+        if not key or key in seen or key in lowered_title:
+            continue
+        seen.add(key)
+        ranked.append(term.strip())
+    return ranked
+
+
+def _format(title: str, abstract: str, terms: list[str]) -> str:
+    return f"title: {title} - abstract: {abstract} - index_terms: {', '.join(terms)}"
+
+
+def build_prompt(
+    title: str,
+    abstract: str,
+    ieee_terms: list[str],
+    dynamic_terms: list[str],
+    budget: int | None = None,
+) -> tuple[str, int]:
+    """
+    Build a classification prompt within a token budget.
+
+    Parameters
+    ----------
+    title : str
+        Paper title, always kept (truncated only if it alone exceeds the budget).
+    abstract : str
+        Paper abstract, truncated from the end when space runs out.
+    ieee_terms : list[str]
+        IEEE controlled index terms.
+    dynamic_terms : list[str]
+        Dynamic (automatically generated) index terms.
+    budget : int | None
+        Maximum prompt length in tokens. Defaults to `cfg.PROMPT_TOKEN_BUDGET`.
+
+    Returns
+    -------
+    tuple[str, int]
+        The prompt text and its length in tokens.
+    """
+    budget = budget or cfg.PROMPT_TOKEN_BUDGET
+    terms = rank_terms(title, ieee_terms, dynamic_terms)
+
+    full = _format(title, abstract, terms)
+    full_tokens = count_tokens(full)
+    if full_tokens <= budget:
+        prompt_tokens.observe(full_tokens)
+        return full, full_tokens
+
+    overhead = count_tokens(_format("", "", []))
+    title = _truncate(title, budget - overhead)
+    remaining = budget - overhead - count_tokens(title)
+
+    # Terms get at least their reserved share, plus whatever the abstract
+    # would leave unused; the abstract gets the rest.
+    abstract_tokens = count_tokens(abstract)
+    term_budget = max(
+        int(remaining * cfg.PROMPT_TERM_SHARE), remaining - abstract_tokens
+    )
+    kept_terms, used = [], 0
+    for term in terms:
+        # One extra token for the ", " separator.
+        cost = count_tokens(term) + (1 if kept_terms else 0)
+        if used + cost > term_budget:
+            break
+        kept_terms.append(term)
+        used += cost
+
+    abstract = _truncate(abstract, remaining - used)
+    prompt = _format(title, abstract, kept_terms)
+    n_tokens = count_tokens(prompt)
+    prompt_tokens.observe(n_tokens)
+    return prompt, n_tokens
@@ -52,14 +52,19 @@ class PaperRepository:
             self.cursor.execute(query, (paper_id, term_type, term))
         self.connection.commit()
 
-    def insert_prompt(self, paper_id: int, prompt: str) -> None:
-        query = "INSERT INTO prompts (paper_id, prompt_text) VALUES (?, ?)"
-        self.cursor.execute(query, (paper_id, prompt))
+    def insert_prompt(
+        self, paper_id: int, prompt: str, token_count: int | None = None
+    ) -> None:
+        query = (
+            "INSERT INTO prompts (paper_id, prompt_text, token_count) VALUES (?, ?, ?)"
+        )
+        self.cursor.execute(query, (paper_id, prompt, token_count))
         self.connection.commit()
 
-    def insert_full_paper(self, paper: ProcessedPaper) -> None:
+    def insert_full_paper(self, paper: ProcessedPaper) -> int | None:
+        """Insert a paper across all tables. Returns its id, or None if skipped."""
         if self.paper_exists(paper.is_number):
-            return
+            return None
         paper_id = self.insert_paper(paper)
         self.insert_authors(paper_id, paper.authors)
         for term_type, terms in [
@@ -67,7 +72,8 @@ class PaperRepository:
             ("dynamic", paper.index_terms_dynamic),
         ]:
             self.insert_index_terms(paper_id, term_type, terms)
-        self.insert_prompt(paper_id, paper.prompt)
+        self.insert_prompt(paper_id, paper.prompt, paper.prompt_tokens)
+        return paper_id
 
     def get_unclassified_papers(self) -> pd.DataFrame:
         return pd.read_sql_query(
@@ -82,16 +88,107 @@ class PaperRepository:
             con=self.connection,
         )
 
+    def get_papers_missing_labels(
+        self,
+        labels: list[str],
+        paper_ids: list[int] | None = None,
+        after_paper_id: int | None = None,
+        limit: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Return papers lacking a classification row for any of `labels`.
+
+        The `missing_labels` column holds the sorted labels still to be scored
+        for each paper, so adding a category only requests the new hypothesis
+        for papers that were classified before. `paper_ids` restricts the
+        result to the given papers. Results are ordered by `paper_id`;
+        `after_paper_id` and `limit` page through them in chunks.
+        """
+        paper_filter = ""
+        params: list = [labels]
+        if paper_ids is not None:
+            paper_filter += " AND p.paper_id IN (SELECT unnest(?::INTEGER[]))"
+            params.append([int(pid) for pid in paper_ids])
+        if after_paper_id is not None:
+            paper_filter += " AND p.paper_id > ?"
+            params.append(int(after_paper_id))
+        limit_clause = f"LIMIT {int(limit)}" if limit else ""
+        return self.connection.execute(
+            f"""
+            SELECT p.paper_id, pr.prompt_text, list_sort(list(l.label)) AS missing_labels
+            FROM papers p
+            JOIN prompts pr ON p.paper_id = pr.paper_id
+            CROSS JOIN (SELECT unnest(?::TEXT[]) AS label) l
+            WHERE NOT EXISTS (
+                SELECT 1 FROM classification c
+                WHERE c.paper_id = p.paper_id AND c.category = l.label
+            )
+            {paper_filter}
+            GROUP BY p.paper_id, pr.prompt_text
+            ORDER BY p.paper_id
+            {limit_clause}
+            """,
+            params,
+        ).df()
+
     def insert_classifications(self, classifications: list[ClassifiedPaper]) -> None:
         df = pd.DataFrame([c.model_dump() for c in classifications])
         self.connection.register("df_classified_view", df)
         self.connection.execute(
-            "INSERT INTO classification (paper_id, category, confidence) "
-            "SELECT paper_id, category, confidence FROM df_classified_view"
+            "INSERT INTO classification (paper_id, category, confidence, stage) "
+            "SELECT paper_id, category, confidence, stage FROM df_classified_view"
         )
         self.connection.unregister("df_classified_view")
         self.connection.commit()
 
+    def get_cached_classifications(
+        self, prompt_hashes: list[str], model_name: str, label_set: str
+    ) -> dict[str, list[tuple[str, float]]]:
+        """Return cached (label, score) vectors keyed by prompt hash."""
+        if not prompt_hashes:
+            return {}
+        df = pd.DataFrame({"prompt_hash": prompt_hashes})
+        self.connection.register("df_prompt_hashes_view", df)
+        rows = self.connection.execute(
+            """
+            SELECT prompt_hash, labels, scores
+            FROM classification_cache
+            WHERE model_name = ? AND label_set = ?
+              AND prompt_hash IN (SELECT prompt_hash FROM df_prompt_hashes_view)
+            """,
+            (model_name, label_set),
+        ).fetchall()
+        self.connection.unregister("df_prompt_hashes_view")
+        return {
+            prompt_hash: list(zip(labels, scores))
+            for prompt_hash, labels, scores in rows
+        }
+
+    def insert_cached_classifications(
+        self,
+        entries: dict[str, list[tuple[str, float]]],
+        model_name: str,
+        label_set: str,
+    ) -> None:
+        """Store (label, score) vectors by prompt hash, keeping existing entries."""
+        if not entries:
+            return
+        df = pd.DataFrame(
+            {
+                "prompt_hash": list(entries),
+                "labels": [[label for label, _ in v] for v in entries.values()],
+                "scores": [[score for _, score in v] for v in entries.values()],
+            }
+        )
+        self.connection.register("df_cache_view", df)
+        self.connection.execute(
+            "INSERT OR IGNORE INTO classification_cache "
+            "SELECT prompt_hash, ?, ?, labels, scores FROM df_cache_view",
+            (model_name, label_set),
+        )
+        self.connection.unregister("df_cache_view")
+        self.connection.commit()
+
     def count_papers(self) -> int:
         return self.cursor.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
 
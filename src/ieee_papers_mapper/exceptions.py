@@ -8,3 +8,11 @@ class IEEEApiError(IEEEPapersError):
 
 class PaperValidationError(IEEEPapersError):
     """Paper data failed Pydantic validation."""
+
+
+class ClassifierBackendError(IEEEPapersError):
+    """Classifier backend is unknown or could not be loaded."""
+
+
+class ClassifierDaemonError(IEEEPapersError):
+    """Request to the classifier daemon failed."""
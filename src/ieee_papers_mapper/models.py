@@ -20,6 +20,7 @@ class ProcessedPaper(BaseModel):
     index_terms_dynamic: list[str] = []
     authors: list[Author]
     prompt: str
+    prompt_tokens: int | None = None
 
     @field_validator("insert_date")
     @classmethod
@@ -32,3 +33,4 @@ class ClassifiedPaper(BaseModel):
     paper_id: int
     category: str
     confidence: float = Field(ge=0.0, le=1.0)
+    stage: str = "zero_shot"
@@ -0,0 +1,25 @@
+import re
+import pytest
+
+
+class WhitespaceTokenizer:
+    """Offline stand-in for the classifier tokenizer: one token per word."""
+
+    def __call__(self, text, add_special_tokens=False, return_offsets_mapping=False):
+        return {"offset_mapping": [m.span() for m in re.finditer(r"\S+", text)]}
+
+
+@pytest.fixture(autouse=True)
+def offline_tokenizer(monkeypatch):
+    """Keep prompt building from downloading the DeBERTa tokenizer in tests."""
+    monkeypatch.setattr(
+        "ieee_papers_mapper.data.prompt_builder._tokenizer", WhitespaceTokenizer()
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_classifier_daemon(monkeypatch):
+    """Never route test classifications to a daemon running on the dev box."""
+    monkeypatch.setattr(
+        "ieee_papers_mapper.config.config.CLASSIFIER_DAEMON_ENABLED", False
+    )
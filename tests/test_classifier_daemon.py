@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+import pytest
+import requests
+from ieee_papers_mapper.data import classify_papers
+from ieee_papers_mapper.data.classifier_daemon import (
+    create_app,
+    daemon_available,
+    classify_via_daemon,
+    _daemon_url,
+)
+from ieee_papers_mapper.exceptions import ClassifierDaemonError
+
+
+@pytest.fixture
+def daemon_client(mocker):
+    def fake_classifier(texts, candidate_labels, multi_label, batch_size):
+        return [{"labels": candidate_labels, "scores": [0.9]} for _ in texts]
+
+    mocker.patch(
+        "ieee_papers_mapper.data.classify_papers._get_classifier",
+        return_value=fake_classifier,
+    )
+    app = create_app()
+    app.config["TESTING"] = True
+    return app.test_client()
+
+
+def test_daemon_health_reports_model(daemon_client):
+    response = daemon_client.get("/health")
+    assert response.status_code == 200
+    assert response.get_json()["model"] == classify_papers.cache_model_key()
+
+
+def test_daemon_classify(daemon_client):
+    response = daemon_client.post(
+        "/classify", json={"texts": ["a", "b"], "labels": ["robotics"]}
+    )
+    assert response.get_json()["scores"] == [[["robotics", 0.9]], [["robotics", 0.9]]]
+
+
+def test_daemon_available_checks_model(monkeypatch, requests_mock):
+    monkeypatch.setattr(
+        "ieee_papers_mapper.config.config.CLASSIFIER_DAEMON_ENABLED", True
+    )
+    requests_mock.get(f"{_daemon_url()}/health", json={"model": "m"})
+    assert daemon_available("m") is True
+    assert daemon_available("other") is False
+
+
+def test_daemon_unavailable_when_not_listening(monkeypatch, requests_mock):
+    monkeypatch.setattr(
+        "ieee_papers_mapper.config.config.CLASSIFIER_DAEMON_ENABLED", True
+    )
+    requests_mock.get(
+        f"{_daemon_url()}/health", exc=requests.exceptions.ConnectionError
+    )
+    assert daemon_available("m") is False
+
+
+def test_classify_via_daemon(requests_mock):
+    requests_mock.post(
+        f"{_daemon_url()}/classify", json={"scores": [[["robotics", 0.4]]]}
+    )
+    assert classify_via_daemon(["a"], ["robotics"]) == [[("robotics", 0.4)]]
+
+
+def test_classify_via_daemon_error(requests_mock):
+    requests_mock.post(f"{_daemon_url()}/classify", status_code=500)
+    with pytest.raises(ClassifierDaemonError):
+        classify_via_daemon(["a"], ["robotics"])
+
+
+def test_classify_texts_routes_to_running_daemon(mocker):
+    mocker.patch(
+        "ieee_papers_mapper.data.classify_papers.daemon_available", return_value=True
+    )
+    remote = mocker.patch(
+        "ieee_papers_mapper.data.classify_papers.classify_via_daemon",
+        return_value=[[("robotics", 0.6)]],
+    )
+    get_classifier = mocker.patch(
+        "ieee_papers_mapper.data.classify_papers._get_classifier"
+    )
+    assert classify_papers.classify_texts(["a"], labels=["robotics"]) == [
+        [("robotics", 0.6)]
+    ]
+    remote.assert_called_once()
+    get_classifier.assert_not_called()
@@ -5,7 +5,9 @@ import pandas as pd
 from ieee_papers_mapper.models import ClassifiedPaper
 from ieee_papers_mapper.data.classify_papers import (
     classify_text,
+    classify_texts,
     classify_all_papers,
+    _length_buckets,
 )
 
 
@@ -30,11 +32,82 @@ def test_classify_text(mocker):
 
 def test_classify_all_papers(mock_prompt_data, mocker):
     mocker.patch(
-        "ieee_papers_mapper.data.classify_papers.classify_text",
-        return_value=[("Category 1", 0.95)],
+        "ieee_papers_mapper.data.classify_papers.classify_texts",
+        return_value=[[("Category 1", 0.95)]],
     )
     result = classify_all_papers(mock_prompt_data)
     assert len(result) == 1
     assert isinstance(result[0], ClassifiedPaper)
     assert result[0].category == "Category 1"
     assert result[0].confidence == 0.95
+
+
+def test_length_buckets_groups_similar_lengths():
+    texts = ["aaaa", "a", "aaa", "aa", "aaaaa"]
+    buckets = _length_buckets(texts, batch_size=2)
+    assert buckets == [[1, 3], [2, 0], [4]]
+
+
+def test_classify_texts_preserves_input_order(mocker):
+    def fake_classifier(texts, candidate_labels, multi_label, batch_size):
+        return [{"labels": ["Category 1"], "scores": [len(t) / 10]} for t in texts]
+
+    mocker.patch(
+        "ieee_papers_mapper.data.classify_papers._get_classifier",
+        return_value=fake_classifier,
+    )
+    result = classify_texts(["abcde", "a", "abc"], batch_size=2)
+    assert result == [
+        [("Category 1", 0.5)],
+        [("Category 1", 0.1)],
+        [("Category 1", 0.3)],
+    ]
+
+
+def test_classify_shard_returns_plain_results(mocker):
+    from ieee_papers_mapper.data.classifier_pool import _classify_shard
+
+    mocker.patch(
+        "ieee_papers_mapper.data.classify_papers.classify_texts",
+        return_value=[[("Category 1", 0.8)], [("Category 1", 0.2)]],
+    )
+    paper_ids, scores, elapsed = _classify_shard([1, 2], ["a", "b"], None)
+    assert paper_ids == [1, 2]
+    assert scores == [[("Category 1", 0.8)], [("Category 1", 0.2)]]
+    assert elapsed >= 0
+
+
+def test_shard_frame_splits_rows():
+    from ieee_papers_mapper.data.classifier_pool import _shard_frame
+
+    df = pd.DataFrame({"paper_id": range(5), "prompt_text": ["x"] * 5})
+    shards = list(_shard_frame(df, 2))
+    assert [len(s) for s in shards] == [2, 2, 1]
+
+
+def test_load_classifier_rejects_unknown_backend():
+    from ieee_papers_mapper.data.classifier_backends import load_classifier
+    from ieee_papers_mapper.exceptions import ClassifierBackendError
+
+    with pytest.raises(ClassifierBackendError):
+        load_classifier("tensorrt")
+
+
+def test_compare_scores():
+    from ieee_papers_mapper.data.classifier_backends import compare_scores
+
+    reference = [[("a", 0.9), ("b", 0.1)], [("a", 0.4), ("b", 0.6)]]
+    candidate = [[("b", 0.12), ("a", 0.88)], [("a", 0.61), ("b", 0.58)]]
+    report = compare_scores(reference, candidate)
+    assert report["prompts"] == 2
+    assert report["max_abs_diff"] == pytest.approx(0.21)
+    assert report["top_label_agreement"] == 0.5
+
+
+def test_classify_texts_uses_explicit_classifier(mocker):
+    get_classifier = mocker.patch(
+        "ieee_papers_mapper.data.classify_papers._get_classifier"
+    )
+    classifier = mocker.MagicMock(return_value=[{"labels": ["a"], "scores": [0.7]}])
+    assert classify_texts(["text"], classifier=classifier) == [[("a", 0.7)]]
+    get_classifier.assert_not_called()
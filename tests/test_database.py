@@ -113,3 +113,44 @@ def test_close_and_reconnect(db):
     assert db.is_connected is False
     db.connect()
     assert db.is_connected is True
+
+
+def test_classification_cache_round_trip(repo):
+    entries = {"abc": [("robotics", 0.9), ("machine learning", 0.2)]}
+    repo.insert_cached_classifications(entries, "model", '["a"]')
+    repo.insert_cached_classifications(
+        {"abc": [("robotics", 0.1)]}, "model", '["a"]'
+    )  # existing entries are kept
+    assert repo.get_cached_classifications(["abc", "def"], "model", '["a"]') == entries
+    assert repo.get_cached_classifications(["abc"], "other-model", '["a"]') == {}
+
+
+def test_export_and_import_table(db, repo, tmp_path):
+    repo.insert_cached_classifications({"abc": [("robotics", 0.9)]}, "model", "[]")
+    path = str(tmp_path / "cache.parquet")
+    assert db.export_table("classification_cache", path) is True
+    assert db.export_table("missing_table", path) is False
+
+    other = Database(name="other", filepath=str(tmp_path))
+    other.initialise()
+    assert other.import_table("classification_cache", path) == 1
+    other.close()
+
+
+def test_add_missing_columns_upgrades_old_schema(tmp_path):
+    import duckdb
+
+    path = tmp_path / "old.duckdb"
+    conn = duckdb.connect(str(path))
+    conn.execute(
+        "CREATE TABLE classification "
+        "(classification_id INTEGER, paper_id INTEGER, category TEXT, confidence REAL)"
+    )
+    conn.execute("INSERT INTO classification VALUES (1, 1, 'robotics', 0.5)")
+    conn.close()
+
+    db = Database(name="old", filepath=str(tmp_path))
+    db.initialise()
+    stage = db.connection.execute("SELECT stage FROM classification").fetchone()[0]
+    assert stage == "zero_shot"
+    db.close()
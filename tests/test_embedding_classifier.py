@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pandas as pd
+from ieee_papers_mapper.data.embedding_classifier import (
+    confident_mask,
+    embedding_scores,
+    classify_first_stage,
+)
+
+
+def _fake_embed(texts, batch_size=None):
+    vectors = {
+        "This paper is about robotics.": [1.0, 0.0],
+        "This paper is about power electronics.": [0.0, 1.0],
+        "robot arm": [1.0, 0.0],
+        "inverter": [0.0, 1.0],
+        "robot inverter": [0.6, 0.8],
+    }
+    return np.array([vectors[t] for t in texts])
+
+
+def test_confident_mask():
+    scores = np.array([[0.95, 0.05], [0.5, 0.01], [0.1, 0.81]])
+    assert confident_mask(scores, (0.2, 0.8)).tolist() == [True, False, True]
+
+
+def test_embedding_scores_are_calibrated(mocker):
+    mocker.patch(
+        "ieee_papers_mapper.data.embedding_classifier.embed_texts",
+        side_effect=_fake_embed,
+    )
+    scores = embedding_scores(["robot arm"], ["robotics", "power electronics"])
+    assert scores.shape == (1, 2)
+    assert scores[0, 0] > 0.99
+    assert scores[0, 1] < 0.01
+
+
+def test_classify_first_stage_routes_ambiguous_papers(mocker, monkeypatch):
+    mocker.patch(
+        "ieee_papers_mapper.data.embedding_classifier.embed_texts",
+        side_effect=_fake_embed,
+    )
+    monkeypatch.setattr(
+        "ieee_papers_mapper.config.config.CASCADE_SIMILARITY_CENTER", 0.7
+    )
+    monkeypatch.setattr("ieee_papers_mapper.config.config.CASCADE_TEMPERATURE", 0.2)
+    df = pd.DataFrame(
+        {
+            "paper_id": [1, 2, 3],
+            "prompt_text": ["robot arm", "inverter", "robot inverter"],
+        }
+    )
+    accepted, ambiguous = classify_first_stage(df, ["robotics", "power electronics"])
+
+    assert {c.paper_id for c in accepted} == {1, 2}
+    assert all(c.stage == "embedding" for c in accepted)
+    assert ambiguous["paper_id"].tolist() == [3]
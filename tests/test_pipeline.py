@@ -125,3 +125,203 @@ def test_run_pipeline_no_new_papers(tmp_path, monkeypatch):
 
     assert result is False
     mock_classify.assert_not_called()
+
+
+def test_classify_new_papers_uses_pool_for_multiple_workers(mocker):
+    from ieee_papers_mapper.data.pipeline import _classify_new_papers
+
+    repo = mocker.MagicMock()
+    repo.get_papers_missing_labels.return_value = pd.DataFrame(
+        {
+            "paper_id": [1, 2],
+            "prompt_text": ["a", "b"],
+            "missing_labels": [["robotics"], ["robotics"]],
+        }
+    )
+    repo.get_cached_classifications.return_value = {}
+    shard_results = [
+        [ClassifiedPaper(paper_id=1, category="robotics", confidence=0.9)],
+        [ClassifiedPaper(paper_id=2, category="robotics", confidence=0.1)],
+    ]
+    pool = mocker.MagicMock()
+    pool.__enter__.return_value.classify.return_value = iter(shard_results)
+    pool_cls = mocker.patch(
+        "ieee_papers_mapper.data.pipeline.ClassifierPool", return_value=pool
+    )
+    mock_classify = mocker.patch("ieee_papers_mapper.data.pipeline.classify_all_papers")
+
+    _classify_new_papers(repo, "run", workers=2, threads_per_worker=4)
+
+    pool_cls.assert_called_once_with(2, 4)
+    mock_classify.assert_not_called()
+    assert repo.insert_classifications.call_count == 2
+
+
+def test_classify_new_papers_serves_cached_prompts(tmp_path, mocker):
+    from ieee_papers_mapper.data.database import Database
+    from ieee_papers_mapper.data.repository import PaperRepository
+    from ieee_papers_mapper.data.pipeline import _classify_new_papers
+    from ieee_papers_mapper.data.classify_papers import (
+        prompt_hash,
+        cache_model_key,
+        label_set_key,
+    )
+    import ieee_papers_mapper.config.config as cfg
+
+    db = Database(name="test", filepath=str(tmp_path))
+    db.initialise()
+    repo = PaperRepository(db.connection)
+    for prompt in ["cached prompt", "fresh prompt"]:
+        paper_id = repo.connection.execute(
+            "INSERT INTO papers (title) VALUES ('t') RETURNING paper_id"
+        ).fetchone()[0]
+        repo.insert_prompt(paper_id, prompt)
+    repo.insert_cached_classifications(
+        {prompt_hash("cached prompt"): [("robotics", 0.8)]},
+        cache_model_key(),
+        label_set_key(cfg.CATEGORIES),
+    )
+    mock_classify = mocker.patch(
+        "ieee_papers_mapper.data.pipeline.classify_all_papers",
+        return_value=[ClassifiedPaper(paper_id=2, category="robotics", confidence=0.3)],
+    )
+
+    _classify_new_papers(repo, "run", workers=1)
+
+    classified = mock_classify.call_args[0][0]
+    assert classified["prompt_text"].tolist() == ["fresh prompt"]
+    rows = repo.cursor.execute(
+        "SELECT paper_id, confidence FROM classification ORDER BY paper_id"
+    ).fetchall()
+    assert [(pid, round(conf, 2)) for pid, conf in rows] == [(1, 0.8), (2, 0.3)]
+    assert (
+        len(
+            repo.get_cached_classifications(
+                [prompt_hash("fresh prompt")],
+                cache_model_key(),
+                label_set_key(cfg.CATEGORIES),
+            )
+        )
+        == 1
+    )
+    db.close()
+
+
+def test_classify_new_papers_scores_only_missing_labels(tmp_path, mocker, monkeypatch):
+    from ieee_papers_mapper.data.database import Database
+    from ieee_papers_mapper.data.repository import PaperRepository
+    from ieee_papers_mapper.data.pipeline import _classify_new_papers
+
+    monkeypatch.setattr(
+        "ieee_papers_mapper.config.config.CATEGORIES", ["robotics", "new topic"]
+    )
+    db = Database(name="test", filepath=str(tmp_path))
+    db.initialise()
+    repo = PaperRepository(db.connection)
+    paper_id = repo.connection.execute(
+        "INSERT INTO papers (title) VALUES ('t') RETURNING paper_id"
+    ).fetchone()[0]
+    repo.insert_prompt(paper_id, "a robot paper")
+    repo.insert_classifications(
+        [ClassifiedPaper(paper_id=paper_id, category="robotics", confidence=0.9)]
+    )
+    mock_classify = mocker.patch(
+        "ieee_papers_mapper.data.pipeline.classify_all_papers",
+        return_value=[
+            ClassifiedPaper(paper_id=paper_id, category="new topic", confidence=0.2)
+        ],
+    )
+
+    _classify_new_papers(repo, "run", workers=1)
+
+    assert mock_classify.call_args.kwargs["labels"] == ["new topic"]
+    rows = repo.cursor.execute(
+        "SELECT category FROM classification ORDER BY category"
+    ).fetchall()
+    assert rows == [("new topic",), ("robotics",)]
+    assert repo.get_papers_missing_labels(["robotics", "new topic"]).empty
+    db.close()
+
+
+def test_run_pipeline_streaming_classifies_pages(tmp_path, monkeypatch, mocker):
+    monkeypatch.setattr("ieee_papers_mapper.config.config.SRC_DIR", str(tmp_path))
+    monkeypatch.setattr("ieee_papers_mapper.config.config.CONFIG_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        "ieee_papers_mapper.config.config.CATEGORIES", ["test category"]
+    )
+    page = pd.DataFrame(
+        {
+            "is_number": ["1"],
+            "insert_date": ["20240615"],
+            "publication_year": ["2024"],
+            "download_count": [0],
+            "citing_patent_count": [0],
+            "title": ["Streamed Paper"],
+            "abstract": ["Abstract"],
+        }
+    )
+    mocker.patch(
+        "ieee_papers_mapper.data.pipeline.get_papers",
+        side_effect=[page, pd.DataFrame()],
+    )
+    mock_classify = mocker.patch(
+        "ieee_papers_mapper.data.pipeline.classify_all_papers",
+        return_value=[
+            ClassifiedPaper(paper_id=1, category="test category", confidence=0.7)
+        ],
+    )
+
+    assert run_pipeline(stream=True) is True
+
+    # Classified once by the streaming consumer; the final pass finds nothing.
+    mock_classify.assert_called_once()
+    conn = duckdb.connect(str(tmp_path / "ieee_papers.duckdb"), read_only=True)
+    count = conn.execute("SELECT COUNT(*) FROM classification").fetchone()[0]
+    conn.close()
+    assert count == 1
+
+
+def test_classification_commits_chunks_and_resumes(tmp_path, mocker, monkeypatch):
+    from ieee_papers_mapper.data.database import Database
+    from ieee_papers_mapper.data.repository import PaperRepository
+    from ieee_papers_mapper.data.pipeline import ClassificationStage
+
+    monkeypatch.setattr("ieee_papers_mapper.config.config.CATEGORIES", ["robotics"])
+    db = Database(name="test", filepath=str(tmp_path))
+    db.initialise()
+    repo = PaperRepository(db.connection)
+    for prompt in ["first prompt", "second prompt"]:
+        paper_id = repo.connection.execute(
+            "INSERT INTO papers (title) VALUES ('t') RETURNING paper_id"
+        ).fetchone()[0]
+        repo.insert_prompt(paper_id, prompt)
+
+    def classify(df, labels):
+        return [
+            ClassifiedPaper(paper_id=pid, category="robotics", confidence=0.5)
+            for pid in df["paper_id"].tolist()
+        ]
+
+    calls = []
+
+    def crash_on_second_chunk(df, labels):
+        calls.append(df["paper_id"].tolist())
+        if len(calls) == 2:
+            raise MemoryError("killed")
+        return classify(df, labels)
+
+    mock_classify = mocker.patch(
+        "ieee_papers_mapper.data.pipeline.classify_all_papers",
+        side_effect=crash_on_second_chunk,
+    )
+    with pytest.raises(MemoryError):
+        with ClassificationStage(repo, "run", workers=1) as stage:
+            stage.run(chunk_size=1)
+    assert repo.count_unclassified() == 1
+
+    mock_classify.side_effect = classify
+    with ClassificationStage(repo, "run", workers=1) as stage:
+        assert stage.run(chunk_size=1) == 1
+    assert mock_classify.call_args[0][0]["paper_id"].tolist() == [2]
+    assert repo.count_unclassified() == 0
+    db.close()
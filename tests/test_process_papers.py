@@ -9,6 +9,7 @@ from ieee_papers_mapper.data.process_papers import (
     _extract_author_info,
     _create_prompt,
 )
+from ieee_papers_mapper.data.prompt_builder import build_prompt, rank_terms
 
 
 @pytest.fixture
@@ -75,3 +76,33 @@ def test_create_prompt():
         result
         == "title: Test Title - abstract: Test Abstract - index_terms: term1, term2"
     )
+
+
+def test_process_papers_records_prompt_tokens(sample_raw_data):
+    papers = process_papers(sample_raw_data)
+    assert papers[0].prompt_tokens == len(papers[0].prompt.split())
+
+
+def test_rank_terms_prefers_ieee_and_drops_duplicates():
+    ranked = rank_terms(
+        "Robotics for Everyone",
+        ["Robotics", "control", "sensors"],
+        ["Control", "lidar"],
+    )
+    assert ranked == ["control", "sensors", "lidar"]
+
+
+def test_build_prompt_respects_token_budget():
+    abstract = " ".join(f"word{i}" for i in range(100))
+    terms = [f"term{i}" for i in range(20)]
+    prompt, n_tokens = build_prompt("Short Title", abstract, terms, [], budget=40)
+    assert n_tokens <= 40
+    assert prompt.startswith("title: Short Title - abstract: word0 word1")
+    assert "term0" in prompt
+    assert "word99" not in prompt
+
+
+def test_build_prompt_keeps_short_prompts_intact():
+    prompt, n_tokens = build_prompt("T", "A", ["x"], ["y"], budget=40)
+    assert prompt == "title: T - abstract: A - index_terms: x, y"
+    assert n_tokens == len(prompt.split())